@@ -1,33 +1,103 @@
 import sys
-import minecraft_launcher_lib
+import importlib.util # Added for checking dependencies without importing them
 import subprocess
 import os
+import re # Added for matching auth server URLs
 import uuid # Added for generating offline UUID
+import hashlib # Added for deriving offline UUID from username
+import logging # Added instead of print, which blocks the GUI thread on slow stdout
 import json # Added for saving/loading settings
 import shutil # Added for file backups
+import time # Added for version list cache expiry
+
+try:
+    import orjson # Faster JSON parsing/serialization when available
+except ImportError:
+    orjson = None
+
+try:
+    import cysimdjson # Faster parsing of large (modded) version JSONs when available
+    _SIMD_PARSER = cysimdjson.JSONParser()
+except ImportError:
+    _SIMD_PARSER = None
+
+logger = logging.getLogger('launcher')
+logger.addHandler(logging.NullHandler()) # Silent unless the entry point configures logging
 
 # --- Settings Management ---
 SETTINGS_FILE = "launcher_settings.json"
 DEFAULT_MINECRAFT_DIR = os.path.join(os.getcwd(), "minecraft")
+VERSIONS_CACHE_TTL = 300 # Seconds before the available versions list is fetched again
+_OFFLINE_HOST_RE = re.compile(r'mojang|minecraft') # Server URLs redirected to localhost for offline play
+_PROFILE_FIELDS = frozenset(map(sys.intern, ['name', 'version_id', 'username', 'memory_gb'])) # Keys of a profile dict
+_SENTINEL = object() # Marks a missing value, distinct from None
+_OFFLINE_UUID_CACHE = {} # username -> offline player UUID
+_JVM_ARGS_CACHE = {} # memory_gb -> (max heap arg, initial heap arg)
+
+def _offline_uuid(username):
+    """Returns the offline-mode UUID for username, the same one offline servers derive
+    (Java's UUID.nameUUIDFromBytes("OfflinePlayer:" + name)), so player data stays tied to the name."""
+    player_uuid = _OFFLINE_UUID_CACHE.get(username)
+    if player_uuid is None:
+        digest = hashlib.md5(f"OfflinePlayer:{username}".encode('utf-8')).digest()
+        player_uuid = _OFFLINE_UUID_CACHE[username] = uuid.UUID(bytes=digest, version=3).hex
+    return player_uuid
+
+def _jvm_args(memory_gb):
+    """Returns the JVM heap arguments for memory_gb, built once per value."""
+    args = _JVM_ARGS_CACHE.get(memory_gb)
+    if args is None:
+        args = _JVM_ARGS_CACHE[memory_gb] = (f"-Xmx{memory_gb}G", f"-Xms{memory_gb}G")
+    return args
+
+def _loads(data):
+    """Parses JSON bytes, using orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj, pretty=True):
+    """Serializes obj to indented JSON bytes, using orjson if it is installed.
+    Without orjson, pretty=False writes compact JSON since stdlib indenting is much slower."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _write_atomic(path, data):
+    """Writes data to path via a temporary file, so a crash never leaves it half-written.
+    The old file is replaced rather than modified, so hardlinks to it keep the previous content."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=max(65536, len(data))) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        # Don't leave a half-written temporary file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 def load_settings():
     """Loads settings from SETTINGS_FILE. Returns defaults if file not found or invalid."""
     default_settings = {
         'minecraft_directory': DEFAULT_MINECRAFT_DIR,
         'profiles': [],
-        'last_selected_profile': None
+        'last_selected_profile': None,
+        'dark_theme': True
     }
     try:
         if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
-                # Validate essential keys and provide defaults
-                if 'minecraft_directory' not in settings:
-                    settings['minecraft_directory'] = DEFAULT_MINECRAFT_DIR
-                if 'profiles' not in settings or not isinstance(settings['profiles'], list):
+            with open(SETTINGS_FILE, 'rb') as f:
+                # Fill in missing keys from the defaults, then validate the profiles type
+                settings = {**default_settings, **_loads(f.read())}
+                if not isinstance(settings['profiles'], list):
                     settings['profiles'] = []
-                if 'last_selected_profile' not in settings:
-                    settings['last_selected_profile'] = None
 
                 # Ensure Minecraft directory exists
                 mc_dir = settings['minecraft_directory']
@@ -35,24 +105,24 @@ def load_settings():
                      try:
                          os.makedirs(mc_dir)
                      except OSError as e:
-                         print(f"Warning: Could not create Minecraft directory {mc_dir}: {e}")
+                         logger.warning("Could not create Minecraft directory %s: %s", mc_dir, e)
                          settings['minecraft_directory'] = DEFAULT_MINECRAFT_DIR
                          if not os.path.exists(DEFAULT_MINECRAFT_DIR):
                              try:
                                  os.makedirs(DEFAULT_MINECRAFT_DIR)
                              except OSError as e2:
-                                 print(f"Fatal: Could not create default Minecraft directory {DEFAULT_MINECRAFT_DIR}: {e2}. Exiting.")
+                                 logger.critical("Could not create default Minecraft directory %s: %s. Exiting.", DEFAULT_MINECRAFT_DIR, e2)
                                  sys.exit(1)
                 return settings
-    except (json.JSONDecodeError, OSError, FileNotFoundError) as e:
-        print(f"Error loading settings: {e}. Using default settings.")
+    except (json.JSONDecodeError, ValueError, OSError, FileNotFoundError) as e: # orjson.JSONDecodeError is a ValueError
+        logger.error("Error loading settings: %s. Using default settings.", e)
 
     # Fallback to default settings if file doesn't exist or loading failed
     if not os.path.exists(DEFAULT_MINECRAFT_DIR):
         try:
             os.makedirs(DEFAULT_MINECRAFT_DIR)
         except OSError as e:
-             print(f"Fatal: Could not create default Minecraft directory {DEFAULT_MINECRAFT_DIR}: {e}. Exiting.")
+             logger.critical("Could not create default Minecraft directory %s: %s. Exiting.", DEFAULT_MINECRAFT_DIR, e)
              sys.exit(1)
     return default_settings
 
@@ -62,10 +132,9 @@ def save_settings(settings):
         # Ensure profiles is a list before saving
         if 'profiles' not in settings or not isinstance(settings['profiles'], list):
             settings['profiles'] = []
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=4)
+        _write_atomic(SETTINGS_FILE, _dumps(settings))
     except OSError as e:
-        print(f"Error saving settings: {e}")
+        logger.error("Error saving settings: %s", e)
 
 # Make sure the directory exists (This part will be handled by load_settings now)
 # MINECRAFT_DIR = os.path.join(os.getcwd(), "minecraft") 
@@ -78,7 +147,14 @@ from PySide6.QtWidgets import (QApplication, QWidget, QLabel, QVBoxLayout,
                                QLineEdit, QSpinBox, QHBoxLayout,
                                QComboBox, QDialog, QDialogButtonBox, 
                                QFormLayout, QCheckBox)
-from PySide6.QtCore import Qt, QThread, Signal, Slot
+from PySide6.QtCore import (Qt, QAbstractListModel, QModelIndex, QProcess, QSignalBlocker, QThread, QTimer,
+                            Signal, Slot)
+
+def _launcher_lib():
+    """Imports minecraft_launcher_lib on first use, to keep launcher startup fast.
+    Call it inside the worker's try, so a broken install reaches the error signals."""
+    import minecraft_launcher_lib
+    return minecraft_launcher_lib
 
 # Thread for installation to avoid freezing GUI
 class InstallThread(QThread):
@@ -87,46 +163,145 @@ class InstallThread(QThread):
     status_update = Signal(str)
     finished_signal = Signal(bool, str) # success (bool), message (str)
 
+    PROGRESS_EMIT_INTERVAL = 1 / 30 # Seconds, the progress bar doesn't need more than ~30 updates/s
+
     def __init__(self, version_id, minecraft_dir):
         super().__init__()
+        # Only plain strings here, everything else is prepared in run() on the worker thread
         self.version_id = version_id
         self.minecraft_dir = minecraft_dir
-        self.callback = {
-            "setStatus": self.set_status,
-            "setProgress": self.set_progress,
-            "setMax": self.set_max
-        }
 
     def set_status(self, status):
         self.status_update.emit(status)
 
     def set_progress(self, value):
-        self.progress_update.emit(value)
+        self._progress = value
+        now = time.monotonic()
+        if now - self._last_emit >= self.PROGRESS_EMIT_INTERVAL:
+            self._last_emit = now
+            self.progress_update.emit(value)
 
     def set_max(self, value):
+        self._flush_progress() # Finish the previous stage before the range changes
         self.progress_max_update.emit(value)
 
+    def _flush_progress(self):
+        """Emits the latest progress value, which throttling may have skipped."""
+        if self._progress is not None:
+            self.progress_update.emit(self._progress)
+
     def run(self):
+        self._last_emit = 0.0
+        self._progress = None # Latest progress value, possibly not emitted yet
+        callback = {
+            "setStatus": self.set_status,
+            "setProgress": self.set_progress,
+            "setMax": self.set_max
+        }
         try:
-            minecraft_launcher_lib.install.install_minecraft_version(
+            _launcher_lib().install.install_minecraft_version(
                 self.version_id,
                 self.minecraft_dir,
-                callback=self.callback
+                callback=callback
             )
+            self._flush_progress()
             self.finished_signal.emit(True, f"Version {self.version_id} installed successfully!")
         except Exception as e:
-            error_message = f"Failed to install {self.version_id}: {e}"
-            print(error_message) # Log error
-            self.finished_signal.emit(False, error_message)
+            logger.error("Failed to install %s: %s", self.version_id, e)
+            self.finished_signal.emit(False, f"Failed to install {self.version_id}: {e}")
+
+
+# Thread for fetching the version list to avoid freezing the profile dialog
+class VersionsFetchThread(QThread):
+    versions_ready = Signal(list)
+    error = Signal(str)
+
+    def __init__(self, minecraft_dir, parent=None):
+        super().__init__(parent)
+        self.minecraft_dir = minecraft_dir
+
+    def run(self):
+        try:
+            versions = _launcher_lib().utils.get_available_versions(self.minecraft_dir)
+            self.versions_ready.emit(versions)
+        except Exception as e:
+            logger.error("Error loading versions for dialog: %s", e)
+            self.error.emit(str(e))
+
+
+# Thread for generating the launch command, it parses the version JSON and library tree
+class LaunchCommandThread(QThread):
+    command_ready = Signal(list)
+    error = Signal(str)
+
+    def __init__(self, version_id, minecraft_dir, options, parent=None):
+        super().__init__(parent)
+        self.version_id = version_id
+        self.minecraft_dir = minecraft_dir
+        self.options = options
+
+    def run(self):
+        try:
+            command = _launcher_lib().command.get_minecraft_command(self.version_id, self.minecraft_dir, self.options)
+            self.command_ready.emit(command)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+# --- Profiles Model (backs the profile combo box) ---
+class ProfilesModel(QAbstractListModel):
+    """List model over the profiles list itself (not a copy), so the combo box only
+    updates the rows that change instead of being cleared and refilled."""
+
+    def __init__(self, profiles, parent=None):
+        super().__init__(parent)
+        self._profiles = profiles
+        # Display names kept in a parallel list, so painting rows doesn't go through the profile dicts
+        self._names = [self._display_name(p) for p in profiles]
+
+    @staticmethod
+    def _display_name(profile):
+        return profile.get('name', 'Unknown')
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._names[index.row()]
+        return None
+
+    def append_profile(self, profile):
+        row = len(self._profiles)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._profiles.append(profile)
+        self._names.append(self._display_name(profile))
+        self.endInsertRows()
+
+    def remove_profile(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._profiles[row]
+        del self._names[row]
+        self.endRemoveRows()
+
+    def replace_profile(self, row, profile):
+        self._profiles[row] = profile
+        self._names[row] = self._display_name(profile)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
 
 
 # --- Profile Edit/Add Dialog ---
 class ProfileDialog(QDialog):
-    def __init__(self, parent=None, existing_profile=None, minecraft_dir=None):
+    versions_loaded = Signal(list) # Emitted when the dialog had to fetch the version list itself
+
+    def __init__(self, parent=None, existing_profile=None, minecraft_dir=None, versions=None):
         super().__init__(parent)
         self.setWindowTitle("Add/Edit Profile" if not existing_profile else f"Edit Profile: {existing_profile.get('name')}")
         self.minecraft_dir = minecraft_dir or DEFAULT_MINECRAFT_DIR # Use default if not provided
         self.existing_profile = existing_profile
+        self.versions = versions # Pre-fetched version list, if the caller has one
+        self.versions_thread = None
 
         self.layout = QVBoxLayout(self)
         self.form_layout = QFormLayout()
@@ -169,26 +344,56 @@ class ProfileDialog(QDialog):
     def load_minecraft_versions(self):
         self.version_combo.clear()
         self.version_combo.setEnabled(False) # Disable while loading
-        try:
-            # This might take a moment, consider a thread for very slow connections
-            versions = minecraft_launcher_lib.utils.get_available_versions(self.minecraft_dir)
-            available_ids = [v['id'] for v in versions]
-            self.version_combo.addItems(available_ids)
-            self.version_combo.setEnabled(True)
-            self.version_combo.setPlaceholderText("Select a version")
-
-            # Select existing version if editing
-            if self.existing_profile:
-                existing_version = self.existing_profile.get('version_id')
-                if existing_version in available_ids:
-                    self.version_combo.setCurrentText(existing_version)
-                else:
-                     self.version_combo.setPlaceholderText(f"Version '{existing_version}' not found?")
+        if self.versions is not None:
+            self.on_versions_ready(self.versions)
+            return
 
-        except Exception as e:
-            print(f"Error loading versions for dialog: {e}")
-            QMessageBox.warning(self, "Error", f"Could not load Minecraft versions: {e}")
-            self.version_combo.setPlaceholderText("Error loading versions")
+        # Fetch in the background, this might take a moment on slow connections
+        self.versions_thread = VersionsFetchThread(self.minecraft_dir, parent=self)
+        self.versions_thread.versions_ready.connect(self.on_versions_ready)
+        self.versions_thread.error.connect(self.on_versions_error)
+        self.versions_thread.finished.connect(self.on_versions_thread_finished)
+        self.versions_thread.finished.connect(self.versions_thread.deleteLater)
+        self.versions_thread.start()
+
+    @Slot()
+    def on_versions_thread_finished(self):
+        self.versions_thread = None
+
+    def done(self, result):
+        # A fetch still running must outlive the dialog, so hand it to our parent instead of
+        # destroying it with us (MainWindow.closeEvent waits for it)
+        if self.versions_thread is not None and self.versions_thread.isRunning():
+            self.versions_thread.versions_ready.disconnect(self.on_versions_ready)
+            self.versions_thread.error.disconnect(self.on_versions_error)
+            self.versions_thread.setParent(self.parent() or QApplication.instance())
+            self.versions_thread = None
+        super().done(result)
+
+    @Slot(list)
+    def on_versions_ready(self, versions):
+        if self.versions is None: # Freshly fetched, let the caller cache it
+            self.versions = versions
+            self.versions_loaded.emit(versions)
+
+        available_ids = [v['id'] for v in versions]
+        self.version_combo.addItems(available_ids)
+        self.version_combo.setEnabled(True)
+        self.version_combo.setPlaceholderText("Select a version")
+
+        # Select existing version if editing
+        if self.existing_profile:
+            existing_version = self.existing_profile.get('version_id')
+            if existing_version in available_ids:
+                self.version_combo.setCurrentText(existing_version)
+            else:
+                 self.version_combo.setPlaceholderText(f"Version '{existing_version}' not found?")
+
+    @Slot(str)
+    def on_versions_error(self, message):
+        self.version_combo.setPlaceholderText("Error loading versions")
+        if self.isVisible():
+            QMessageBox.warning(self, "Error", f"Could not load Minecraft versions: {message}")
 
     def get_profile_data(self):
         """Returns the entered profile data as a dictionary."""
@@ -219,20 +424,38 @@ class ProfileDialog(QDialog):
 
 
 class MainWindow(QWidget):
+    status_signal = Signal(str) # Status label text, delivered on the next event loop iteration
+
     def __init__(self):
         super().__init__()
+        self._ui_ready = False # Set once all widgets exist, gates on_profile_selected
 
         # Load Settings
         self.settings = load_settings()
         self.minecraft_dir = self.settings.get('minecraft_directory', DEFAULT_MINECRAFT_DIR)
-        # Store profiles directly for easier access
-        self.profiles = self.settings.get('profiles', []) 
+        self._versions_dir = os.path.join(self.minecraft_dir, 'versions')
+        # Store profiles directly for easier access (same list object as in settings, mutated in place)
+        self.profiles = self.settings.setdefault('profiles', [])
+        self._rebuild_index()
+        self._profile_names_lower = {p.get('name', '').lower() for p in self.profiles} # For duplicate name checks
         self.last_selected_profile_name = self.settings.get('last_selected_profile', None)
         self.current_selected_profile = None # Will hold the dictionary of the selected profile
 
         self.setWindowTitle("Minecraft Launcher")
         self.setGeometry(100, 100, 500, 550)
         self.install_thread = None # To hold the installation thread
+        self.launch_thread = None # To hold the launch command thread
+        self._pending_launch = None # (command cache key, profile name) of the launch in progress
+        self._versions_cache = (0.0, None) # (fetch time, versions) shared by profile dialogs
+        self._version_installed_cache = {} # version_id -> bool, cleared when an install finishes
+        self._version_json_cache = {} # version_id -> (st_mtime_ns, parsed version JSON)
+        self._cmd_cache = {} # (version_id, username, memory_gb, minecraft_dir) -> launch command
+
+        # Debounce settings writes so typing in a field doesn't rewrite the file on every keystroke
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(lambda: save_settings(self.settings))
 
         self.layout = QVBoxLayout(self)
 
@@ -243,6 +466,7 @@ class MainWindow(QWidget):
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Select or create a profile")
         self.username_input.setEnabled(False) # Enabled when profile selected
+        self.username_input.textChanged.connect(self._on_username_changed)
         self.username_layout.addWidget(self.username_label)
         self.username_layout.addWidget(self.username_input)
         self.layout.addLayout(self.username_layout)
@@ -253,6 +477,7 @@ class MainWindow(QWidget):
         self.memory_spinbox = QSpinBox()
         self.memory_spinbox.setRange(1, 16) 
         self.memory_spinbox.setEnabled(False) # Enabled when profile selected
+        self.memory_spinbox.valueChanged.connect(self._on_memory_changed)
         self.memory_layout.addWidget(self.memory_label)
         self.memory_layout.addWidget(self.memory_spinbox)
         self.layout.addLayout(self.memory_layout)
@@ -278,7 +503,13 @@ class MainWindow(QWidget):
 
         self.profile_selection_layout = QHBoxLayout()
         self.profile_combo = QComboBox()
+        self.profiles_model = ProfilesModel(self.profiles, self)
+        self.profile_combo.setModel(self.profiles_model)
         self.profile_combo.setPlaceholderText("No profiles created")
+        # Don't measure every item on (re)population, profile lists can get long
+        self.profile_combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.profile_combo.setMinimumContentsLength(24)
+        self.profile_combo.view().setUniformItemSizes(True)
         self.profile_combo.currentIndexChanged.connect(self.on_profile_selected)
         self.profile_selection_layout.addWidget(self.profile_combo)
 
@@ -306,6 +537,7 @@ class MainWindow(QWidget):
         self.status_label = QLabel("")
         self.status_label.setVisible(False) # Hide initially
         self.layout.addWidget(self.status_label)
+        self.status_signal.connect(self.status_label.setText, Qt.ConnectionType.QueuedConnection)
 
         # Action button (Install/Launch)
         self.action_button = QPushButton("Select or create a profile")
@@ -314,83 +546,87 @@ class MainWindow(QWidget):
         self.layout.addWidget(self.action_button)
 
         # Initial UI state update based on selected profile
-        self.update_profile_list()
-
-    def update_profile_list(self):
-        """Update the profile combo box with the current profiles."""
+        self._ui_ready = True
+        self.restore_profile_selection()
+
+    def _rebuild_index(self):
+        """Rebuilds the name -> profile and id(profile) -> list index lookups from scratch.
+        Add and edit update them in place, only a delete (which shifts the later indices) needs this."""
+        self._profiles_by_name = {p.get('name'): p for p in self.profiles}
+        self._profile_index = {id(p): i for i, p in enumerate(self.profiles)}
+
+    def _version_json_path(self, version_id):
+        """Returns the path of the version's JSON file inside the versions directory."""
+        return f"{self._versions_dir}{os.sep}{version_id}{os.sep}{version_id}.json"
+
+    def _is_version_installed(self, version_id):
+        """Returns whether the version's JSON exists, caching the result to avoid a stat per click."""
+        installed = self._version_installed_cache.get(version_id)
+        if installed is None:
+            installed = os.path.isfile(self._version_json_path(version_id))
+            self._version_installed_cache[version_id] = installed
+        return installed
+
+    def _load_version_json(self, version_id):
+        """Returns the parsed version JSON, reparsing only if the file changed since the last load."""
+        version_json_path = self._version_json_path(version_id)
+        mtime_ns = os.stat(version_json_path).st_mtime_ns
+        cached = self._version_json_cache.get(version_id)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        with open(version_json_path, 'rb') as f:
+            raw = f.read()
+        # Materialize to a dict, configure_offline_mode modifies it (cysimdjson documents are read-only)
+        version_data = _SIMD_PARSER.parse(raw).export() if _SIMD_PARSER is not None else _loads(raw)
+        self._version_json_cache[version_id] = (mtime_ns, version_data)
+        return version_data
+
+    def get_versions(self):
+        """Returns the cached Minecraft versions, or None if the cache is empty or older than VERSIONS_CACHE_TTL."""
+        timestamp, versions = self._versions_cache
+        if versions is not None and time.time() - timestamp < VERSIONS_CACHE_TTL:
+            return versions
+        return None # ProfileDialog will fetch them in the background
+
+    @Slot(list)
+    def cache_versions(self, versions):
+        self._versions_cache = (time.time(), versions)
+
+    def restore_profile_selection(self):
+        """Select the last selected profile in the combo box, the model already holds the profiles."""
         # Block signals temporarily to avoid triggering selection callbacks
-        self.profile_combo.blockSignals(True)
-        self.profile_combo.clear()
-        
-        # Add profiles to combo
-        for profile in self.profiles:
-            name = profile.get('name', 'Unknown')
-            self.profile_combo.addItem(name)
-        
-        # Try to select the last selected profile or the first profile
-        if self.profiles:
-            index_to_select = 0  # Default to first profile
-            
-            if self.last_selected_profile_name:
+        with QSignalBlocker(self.profile_combo):
+            # Try to select the last selected profile or the first profile (-1 if there are no profiles)
+            index_to_select = 0 if self.profiles else -1
+            if self.last_selected_profile_name and self.last_selected_profile_name in self._profiles_by_name:
                 # Find index of last selected profile
-                for i, profile in enumerate(self.profiles):
-                    if profile.get('name') == self.last_selected_profile_name:
-                        index_to_select = i
-                        break
-            
+                index_to_select = self._profile_index[id(self._profiles_by_name[self.last_selected_profile_name])]
             self.profile_combo.setCurrentIndex(index_to_select)
         
-        # Re-enable signals
-        self.profile_combo.blockSignals(False)
-        
-        # Manually trigger selection handler
-        if self.profiles:
-            if hasattr(self, 'action_button'):  # Перевірка, чи існує action_button перед викликом on_profile_selected
-                self.on_profile_selected(self.profile_combo.currentIndex())
-        else:
-            if hasattr(self, 'action_button'):  # Перевірка, чи існує action_button перед викликом on_profile_selected
-                self.on_profile_selected(-1)  # No profiles
+        # Manually trigger selection handler once
+        self.on_profile_selected(index_to_select)
 
     @Slot(int)
     def on_profile_selected(self, index):
-        # Перевірка наявності необхідних атрибутів
-        if not hasattr(self, 'action_button') or not hasattr(self, 'username_input') or not hasattr(self, 'memory_spinbox'):
+        # Перевірка, чи вже створені всі віджети
+        if not self._ui_ready:
             return  # Виходимо, якщо атрибути ще не створені
             
         if index == -1:  # No selection
-            self.current_selected_profile = None
-            self.username_input.setText("")
-            self.username_input.setEnabled(False)
-            self.memory_spinbox.setValue(2)
-            self.memory_spinbox.setEnabled(False)
-            self.action_button.setText("Select or create a profile")
-            self.action_button.setEnabled(False)
-            if hasattr(self, 'fix_version_button'):
-                self.fix_version_button.setEnabled(False)
-            if hasattr(self, 'edit_profile_button'):
-                self.edit_profile_button.setEnabled(False)
-            if hasattr(self, 'delete_profile_button'):
-                self.delete_profile_button.setEnabled(False)
+            self._clear_selection_ui()
             return
 
         # Get profile from combo box
         profile_name = self.profile_combo.currentText()
-        found_profile = None
-        for profile in self.profiles:
-            if profile.get('name') == profile_name:
-                found_profile = profile
-                break
+        found_profile = self._profiles_by_name.get(profile_name)
 
         if not found_profile:
-            print(f"Error: Profile '{profile_name}' not found in profiles list")
+            logger.error("Profile '%s' not found in profiles list", profile_name)
             self.current_selected_profile = None
             self.action_button.setEnabled(False)
-            if hasattr(self, 'fix_version_button'):
-                self.fix_version_button.setEnabled(False)
-            if hasattr(self, 'edit_profile_button'):
-                self.edit_profile_button.setEnabled(False)
-            if hasattr(self, 'delete_profile_button'):
-                self.delete_profile_button.setEnabled(False)
+            self.fix_version_button.setEnabled(False)
+            self.edit_profile_button.setEnabled(False)
+            self.delete_profile_button.setEnabled(False)
             return
 
         # Update current selected profile and UI fields
@@ -399,52 +635,53 @@ class MainWindow(QWidget):
         self.username_input.setEnabled(True)
         self.memory_spinbox.setValue(found_profile.get('memory_gb', 2))
         self.memory_spinbox.setEnabled(True)
-        if hasattr(self, 'fix_version_button'):
-            self.fix_version_button.setEnabled(True)
+        self.fix_version_button.setEnabled(True)
         
         # Активуємо кнопки редагування і видалення профілю
-        if hasattr(self, 'edit_profile_button'):
-            self.edit_profile_button.setEnabled(True)
-        if hasattr(self, 'delete_profile_button'):
-            self.delete_profile_button.setEnabled(True)
-        
-        # Відключаємо існуючі сигнали перед підключенням нових, щоб уникнути дублювання
-        try:
-            self.username_input.textChanged.disconnect()
-        except:
-            pass
-        try:
-            self.memory_spinbox.valueChanged.disconnect()
-        except:
-            pass
-        
-        # Check if needed to update the profile when values change
-        self.username_input.textChanged.connect(lambda text: self.update_profile_field('username', text))
-        self.memory_spinbox.valueChanged.connect(lambda value: self.update_profile_field('memory_gb', value))
+        self.edit_profile_button.setEnabled(True)
+        self.delete_profile_button.setEnabled(True)
 
         # Update action button based on version install status
         version_id = found_profile.get('version_id', None)
         if not version_id:
             self.action_button.setText("Select version in Edit Profile")
             self.action_button.setEnabled(False)
-            if hasattr(self, 'status_label'):
-                self.status_label.setText("Profile has no Minecraft version selected.")
-                self.status_label.setVisible(True)
+            self.status_label.setText("Profile has no Minecraft version selected.")
+            self.status_label.setVisible(True)
             return
 
         # Check if version is installed
-        version_file_path = os.path.join(self.minecraft_dir, 'versions', version_id, f'{version_id}.json')
-        if os.path.exists(version_file_path):
+        if self._is_version_installed(version_id):
             self.action_button.setText(f"Launch {profile_name}")
             self.action_button.setEnabled(True)
-            if hasattr(self, 'status_label'):
-                self.status_label.setVisible(False)
+            self.status_label.setVisible(False)
         else:
             self.action_button.setText(f"Install {version_id}")
             self.action_button.setEnabled(True)
-            if hasattr(self, 'status_label'):
-                self.status_label.setText(f"Version {version_id} needs to be installed first.")
-                self.status_label.setVisible(True)
+            self.status_label.setText(f"Version {version_id} needs to be installed first.")
+            self.status_label.setVisible(True)
+
+    def _clear_selection_ui(self):
+        """Puts the profile fields and buttons into the "nothing selected" state."""
+        self.current_selected_profile = None
+        self.username_input.setText("")
+        self.username_input.setEnabled(False)
+        self.memory_spinbox.setValue(2)
+        self.memory_spinbox.setEnabled(False)
+        self.action_button.setText("Select or create a profile")
+        self.action_button.setEnabled(False)
+        self.fix_version_button.setEnabled(False)
+        self.edit_profile_button.setEnabled(False)
+        self.delete_profile_button.setEnabled(False)
+
+    # Persistent slots, they always write to whichever profile is selected at call time
+    @Slot(str)
+    def _on_username_changed(self, text):
+        self.update_profile_field('username', text)
+
+    @Slot(int)
+    def _on_memory_changed(self, value):
+        self.update_profile_field('memory_gb', value)
 
     # --- Installation UI Slots ---
     @Slot(int)
@@ -471,10 +708,15 @@ class MainWindow(QWidget):
         self.edit_profile_button.setEnabled(self.current_selected_profile is not None)
         self.delete_profile_button.setEnabled(self.current_selected_profile is not None)
 
+        # Forget the cached install state and commands, the version may exist (or differ) now
+        self._version_installed_cache.pop(self.install_thread.version_id, None)
+        self._cmd_cache.clear()
+
         # Reset install thread reference
         self.install_thread = None 
 
         if success:
+            self._versions_cache = (0.0, None) # Newly installed version must show up in dialogs
             QMessageBox.information(self, "Installation Complete", message)
             # Optionally, try launching again automatically after successful install
             # self.start_launch()
@@ -490,19 +732,20 @@ class MainWindow(QWidget):
         """Configure the game to allow playing in offline mode, including multiplayer."""
         try:
             # Шлях до файлу конфігурації авторизації
-            version_folder = os.path.join(self.minecraft_dir, 'versions', version_id)
-            version_json_path = os.path.join(version_folder, f'{version_id}.json')
+            version_json_path = self._version_json_path(version_id)
             
             # Створюємо резервну копію файлу, якщо вона ще не існує
             backup_path = version_json_path + '.backup'
-            if not os.path.exists(backup_path) and os.path.exists(version_json_path):
-                shutil.copy2(version_json_path, backup_path)
-                self.status_label.setText(f"Created backup of {version_id}.json")
-                QApplication.processEvents()
+            if self._is_version_installed(version_id) and not os.path.isfile(backup_path):
+                # Hardlink is enough, the file is later replaced instead of modified in place
+                try:
+                    os.link(version_json_path, backup_path)
+                except OSError:
+                    shutil.copy2(version_json_path, backup_path)
+                self.status_signal.emit(f"Created backup of {version_id}.json")
             
             # Читаємо файл конфігурації
-            with open(version_json_path, 'r') as f:
-                version_data = json.load(f)
+            version_data = self._load_version_json(version_id)
             
             # Змінюємо налаштування автентифікації
             if 'arguments' in version_data and 'game' in version_data['arguments']:
@@ -521,7 +764,7 @@ class MainWindow(QWidget):
                 net_servers = version_data['net']['server']
                 # Змінюємо усі сервери автентифікації на локальну адресу
                 for key in net_servers:
-                    if isinstance(net_servers[key], str) and ('mojang' in net_servers[key] or 'minecraft' in net_servers[key]):
+                    if isinstance(value := net_servers[key], str) and _OFFLINE_HOST_RE.search(value):
                         net_servers[key] = "http://127.0.0.1:8080"
             
             # На випадок, якщо структура файлу інша
@@ -533,12 +776,14 @@ class MainWindow(QWidget):
                 version_data['servicesBaseUrl'] = "http://127.0.0.1:8080"
                 
             # Зберігаємо модифікований файл
-            with open(version_json_path, 'w') as f:
-                json.dump(version_data, f, indent=2)
+            _write_atomic(version_json_path, _dumps(version_data, pretty=False)) # Machine-read file
+            self._cmd_cache.clear() # Launch arguments may have changed
+            self._version_json_cache[version_id] = (os.stat(version_json_path).st_mtime_ns, version_data)
             
             return True
         except Exception as e:
-            print(f"Failed to configure offline mode: {e}")
+            self._version_json_cache.pop(version_id, None) # Cached dict may be modified but not saved
+            logger.error("Failed to configure offline mode: %s", e)
             QMessageBox.warning(self, "Offline Mode Configuration", 
                               f"Failed to configure offline mode: {e}\nMultiplayer might be unavailable.")
             return False
@@ -548,6 +793,8 @@ class MainWindow(QWidget):
         if not self.current_selected_profile:
             QMessageBox.warning(self, "Warning", "Please select a profile to launch.")
             return
+        if self.launch_thread is not None:
+            return # Previous launch is still generating its command
 
         version_id = self.current_selected_profile.get('version_id')
         if not version_id:
@@ -555,10 +802,9 @@ class MainWindow(QWidget):
              return
              
         # Check if version is installed ( Reuse logic from old update_action_button or add new check )
-        version_file_path = os.path.join(self.minecraft_dir, 'versions', version_id, f'{version_id}.json')
-        if not os.path.exists(version_file_path):
+        if not self._is_version_installed(version_id):
             # Version not found, trigger installation instead of showing warning
-            print(f"Version {version_id} not found locally. Starting installation.")
+            logger.info("Version %s not found locally. Starting installation.", version_id)
             self.start_installation_for_profile(self.current_selected_profile)
             return # Stop the launch process, installation will handle next steps
 
@@ -566,20 +812,19 @@ class MainWindow(QWidget):
         profile_name = self.current_selected_profile.get('name')
         self.action_button.setEnabled(False)
         self.action_button.setText(f"Launching {profile_name}...")
-        self.status_label.setText(f"Preparing launch for {profile_name} ({version_id})...")
+        self.status_signal.emit(f"Preparing launch for {profile_name} ({version_id})...")
         self.status_label.setVisible(True)
-        QApplication.processEvents()
 
         # --- Get Profile Options ---
         username = self.current_selected_profile.get('username', "Player")
         memory_gb = self.current_selected_profile.get('memory_gb', 2)
-        jvm_arguments = [f"-Xmx{memory_gb}G", f"-Xms{memory_gb}G"]
+        jvm_arguments = list(_jvm_args(memory_gb))
         # Add profile specific JVM args later if needed
 
         # --- Set Launch Options ---
         options = {
             "username": username,
-            "uuid": str(uuid.uuid4()), # Generate new UUID each time for offline
+            "uuid": _offline_uuid(username), # Stable offline UUID derived from the username
             "token": "",
             "jvmArguments": jvm_arguments
         }
@@ -593,26 +838,64 @@ class MainWindow(QWidget):
             "--skipMultiplayerWarning": ""
         }
 
-        try:
-            self.status_label.setText(f"Generating launch command...")
-            QApplication.processEvents()
-            command = minecraft_launcher_lib.command.get_minecraft_command(version_id, self.minecraft_dir, options)
-            print("Launch Command:", command)
-
-            self.status_label.setText(f"Starting {profile_name}...")
-            QApplication.processEvents()
-            # Use Popen for non-blocking launch
-            subprocess.Popen(command)
-            self.status_label.setText(f"{profile_name} launched! You can close the launcher.")
-            # Optionally close the launcher after successful launch:
-            # self.close()
-        except Exception as e:
-            error_message = f"Failed to launch {profile_name}: {e}"
-            print(error_message)
-            QMessageBox.critical(self, "Launch Failed", error_message)
-            self.status_label.setVisible(False)
+        # Reuse the command from a previous launch with the same options
+        cmd_key = (version_id, username, memory_gb, self.minecraft_dir)
+        command = self._cmd_cache.get(cmd_key)
+        if command is not None:
+            self.run_game(profile_name, command)
+            return
 
-        # Re-enable button and update state AFTER launch attempt
+        # Generate the command in a worker thread, it reads the version JSON and library tree
+        self.status_signal.emit("Generating launch command...")
+        self._pending_launch = (cmd_key, profile_name)
+        self.launch_thread = LaunchCommandThread(version_id, self.minecraft_dir, options, parent=self)
+        self.launch_thread.command_ready.connect(self.on_launch_command_ready)
+        self.launch_thread.error.connect(self.on_launch_command_error)
+        # Drop the reference and the QThread only once run() has returned
+        self.launch_thread.finished.connect(self.on_launch_thread_finished)
+        self.launch_thread.finished.connect(self.launch_thread.deleteLater)
+        self.launch_thread.start()
+
+    @Slot(list)
+    def on_launch_command_ready(self, command):
+        cmd_key, profile_name = self._pending_launch
+        self._cmd_cache[cmd_key] = command
+        self.run_game(profile_name, command)
+
+    @Slot(str)
+    def on_launch_command_error(self, message):
+        _, profile_name = self._pending_launch
+        self.on_launch_failed(profile_name, message)
+
+    @Slot()
+    def on_launch_thread_finished(self):
+        self.launch_thread = None
+
+    def run_game(self, profile_name, command):
+        """Starts the game with the generated command and restores the action button."""
+        logger.debug("Launch Command: %s", command)
+        # Start detached through QProcess so the game keeps running after the launcher closes
+        game_process = QProcess(self)
+        game_process.setProgram(command[0])
+        game_process.setArguments(command[1:])
+        started = game_process.startDetached()
+        game_process.deleteLater()
+        if not started:
+            self.on_launch_failed(profile_name, game_process.errorString())
+            return
+        self.status_signal.emit(f"{profile_name} launched! You can close the launcher.")
+        # Optionally close the launcher after successful launch:
+        # self.close()
+        self.reset_action_button()
+
+    def on_launch_failed(self, profile_name, error):
+        logger.error("Failed to launch %s: %s", profile_name, error)
+        QMessageBox.critical(self, "Launch Failed", f"Failed to launch {profile_name}: {error}")
+        self.status_label.setVisible(False)
+        self.reset_action_button()
+
+    def reset_action_button(self):
+        """Re-enable button and update state AFTER launch attempt."""
         self.action_button.setEnabled(True)
         if self.current_selected_profile: # Check if profile still exists
              self.action_button.setText(f"Launch {self.current_selected_profile.get('name')}")
@@ -633,7 +916,7 @@ class MainWindow(QWidget):
             QMessageBox.critical(self, "Error", f"Profile '{profile_name}' has no version selected!")
             return
 
-        print(f"Starting installation for {version_id}...")
+        logger.info("Starting installation for %s...", version_id)
 
         # Disable UI elements
         self.action_button.setEnabled(False)
@@ -649,7 +932,6 @@ class MainWindow(QWidget):
         self.progress_bar.setVisible(True)
         self.status_label.setText(f"Preparing to install {version_id}...")
         self.status_label.setVisible(True)
-        QApplication.processEvents()
 
         # Create and start thread
         self.install_thread = InstallThread(version_id, self.minecraft_dir)
@@ -664,23 +946,29 @@ class MainWindow(QWidget):
 
     # --- Profile Management Methods ---
     def add_profile(self):
-        dialog = ProfileDialog(parent=self, minecraft_dir=self.minecraft_dir)
+        dialog = ProfileDialog(parent=self, minecraft_dir=self.minecraft_dir, versions=self.get_versions())
+        dialog.versions_loaded.connect(self.cache_versions)
         result = dialog.exec()
+        dialog.deleteLater() # Data is read below, before control returns to the event loop
 
         if result == QDialog.Accepted:
             new_data = dialog.get_profile_data() # Already validated in accept()
             if new_data:
                  # Check for duplicate name (case-insensitive)
-                existing_names = [p.get('name', '').lower() for p in self.profiles]
-                if new_data['name'].lower() in existing_names:
+                if new_data['name'].lower() in self._profile_names_lower:
                     QMessageBox.warning(self, "Error", f"A profile named '{new_data['name']}' already exists.")
                     return # Or re-open dialog?
 
-                self.profiles.append(new_data)
+                # Append just the new row instead of rebuilding the combo box
+                with QSignalBlocker(self.profile_combo):
+                    self.profiles_model.append_profile(new_data)
+                    self.profile_combo.setCurrentIndex(len(self.profiles) - 1)
+                self._profiles_by_name[new_data['name']] = new_data
+                self._profile_index[id(new_data)] = len(self.profiles) - 1
+                self._profile_names_lower.add(new_data['name'].lower())
                 self.last_selected_profile_name = new_data['name'] # Select new profile
-                self.update_profile_list() # Refresh combo box
-                # Save settings immediately? Or wait for close?
-                # save_settings(self.settings)
+                self.on_profile_selected(self.profile_combo.currentIndex())
+                self._save_timer.start() # Persist on idle, coalesced with other pending changes
 
     def edit_profile(self):
         if not self.current_selected_profile:
@@ -689,49 +977,77 @@ class MainWindow(QWidget):
         profile_to_edit = self.current_selected_profile
         profile_original_name = profile_to_edit.get('name')
 
-        dialog = ProfileDialog(parent=self, existing_profile=profile_to_edit, minecraft_dir=self.minecraft_dir)
+        dialog = ProfileDialog(parent=self, existing_profile=profile_to_edit, minecraft_dir=self.minecraft_dir,
+                               versions=self.get_versions())
+        dialog.versions_loaded.connect(self.cache_versions)
         result = dialog.exec()
+        dialog.deleteLater() # Data is read below, before control returns to the event loop
 
         if result == QDialog.Accepted:
             updated_data = dialog.get_profile_data() # Already validated
             if updated_data:
                 # Check for duplicate name if name changed (case-insensitive)
                 if updated_data['name'].lower() != profile_original_name.lower():
-                    existing_names = [p.get('name', '').lower() for p in self.profiles if p is not profile_to_edit]
-                    if updated_data['name'].lower() in existing_names:
+                    if updated_data['name'].lower() in self._profile_names_lower:
                         QMessageBox.warning(self, "Error", f"Another profile named '{updated_data['name']}' already exists.")
                         return
                 
                 # Find the profile in the list and update it
                 # This is safer than assuming self.current_selected_profile is still correct if list changes
-                for i, p in enumerate(self.profiles):
-                    if p is profile_to_edit: # Use identity check
-                        self.profiles[i] = updated_data
-                        break
+                i = self._profile_index.get(id(profile_to_edit)) # Identity based lookup
+                if i is None:
+                    return # Profile was removed while the dialog was open
+                with QSignalBlocker(self.profile_combo):
+                    self.profiles_model.replace_profile(i, updated_data) # Refreshes just this row
+                    self.profile_combo.setCurrentIndex(i)
+                self._profiles_by_name.pop(profile_original_name, None)
+                self._profiles_by_name[updated_data['name']] = updated_data
+                self._profile_index[id(updated_data)] = i
+                del self._profile_index[id(profile_to_edit)]
+                self._profile_names_lower.discard(profile_original_name.lower())
+                self._profile_names_lower.add(updated_data['name'].lower())
                 
                 self.last_selected_profile_name = updated_data['name'] # Select edited profile
-                self.update_profile_list() # Refresh combo box
-                # Save settings immediately? Or wait for close?
-                # save_settings(self.settings)
+                self.on_profile_selected(i) # Show the updated fields
+                self._save_timer.start() # Persist on idle, coalesced with other pending changes
 
     def delete_profile(self):
         if not self.current_selected_profile:
             return
         profile_name = self.current_selected_profile.get('name')
-        reply = QMessageBox.question(self, 'Delete Profile', 
-                                       f"Are you sure you want to delete the profile '{profile_name}'?",
-                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                       QMessageBox.StandardButton.No)
-
-        if reply == QMessageBox.StandardButton.Yes:
-            print(f"Deleting profile: {profile_name}")
-            self.profiles.remove(self.current_selected_profile)
-            self.current_selected_profile = None # Deselect
-            self.last_selected_profile_name = None # Clear last selected if it was deleted
-            self.update_profile_list() # Update combo box
-            # No need to save settings here, will be saved on closeEvent
-            # Or call save_settings(self.settings) if immediate persistence is desired
-            self.on_profile_selected(self.profile_combo.currentIndex()) # Update UI state
+        # Window-modal and opened without exec(), so no nested event loop (install progress keeps updating)
+        confirm_box = QMessageBox(QMessageBox.Icon.Question, 'Delete Profile',
+                                  f"Are you sure you want to delete the profile '{profile_name}'?",
+                                  QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self)
+        confirm_box.setDefaultButton(QMessageBox.StandardButton.No)
+        confirm_box.setWindowModality(Qt.WindowModality.WindowModal)
+        confirm_box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        profile_to_delete = self.current_selected_profile
+        confirm_box.buttonClicked.connect(
+            lambda button: self._on_delete_confirmed(confirm_box.standardButton(button), profile_to_delete))
+        confirm_box.open()
+
+    def _on_delete_confirmed(self, reply, profile):
+        """Deletes the profile once the user confirmed it in the delete_profile message box."""
+        if reply != QMessageBox.StandardButton.Yes or id(profile) not in self._profile_index:
+            return
+        profile_name = profile.get('name')
+        logger.debug("Deleting profile: %s", profile_name)
+        index = self._profile_index[id(profile)] # Combo rows mirror self.profiles
+        # Remove just this row instead of rebuilding the combo box, then select the first profile
+        with QSignalBlocker(self.profile_combo):
+            self.profiles_model.remove_profile(index)
+            self.profile_combo.setCurrentIndex(0 if self.profiles else -1)
+        self._rebuild_index()
+        self._profile_names_lower.discard(profile_name.lower())
+        self.current_selected_profile = None # Deselect
+        self.last_selected_profile_name = None # Clear last selected if it was deleted
+        # Update UI state once (the combo signal was blocked above)
+        if self.profiles:
+            self.on_profile_selected(0)
+        else:
+            self._clear_selection_ui() # Nothing left to select, no need to go through the selection handler
+        self._save_timer.start() # Persist on idle, coalesced with other pending changes
 
     def closeEvent(self, event):
         """Save settings when the window is closed."""
@@ -740,9 +1056,16 @@ class MainWindow(QWidget):
             self.settings['last_selected_profile'] = self.current_selected_profile.get('name')
         else:
              self.settings['last_selected_profile'] = None
-        # Ensure profiles are correctly stored back in settings dict
-        self.settings['profiles'] = self.profiles 
+        self._save_timer.stop() # Pending write is covered by the save below
         save_settings(self.settings)
+        # A running QThread must not be destroyed with the window, let version fetches of closed dialogs finish
+        for thread in self.findChildren(VersionsFetchThread):
+            thread.wait()
+        # Same for the launch command generation
+        if self.launch_thread is not None:
+            self.launch_thread.command_ready.disconnect(self.on_launch_command_ready) # Closing cancels the launch
+            self.launch_thread.error.disconnect(self.on_launch_command_error)
+            self.launch_thread.wait()
         event.accept()
 
     def fix_version_for_offline(self):
@@ -757,8 +1080,7 @@ class MainWindow(QWidget):
             return
             
         # Проверяем, установлена ли версия
-        version_file_path = os.path.join(self.minecraft_dir, 'versions', version_id, f'{version_id}.json')
-        if not os.path.exists(version_file_path):
+        if not self._is_version_installed(version_id):
             reply = QMessageBox.question(self, "Version Not Installed", 
                                        f"The version {version_id} is not installed. Install it now?", 
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
@@ -777,37 +1099,43 @@ class MainWindow(QWidget):
         if not self.current_selected_profile:
             return
             
-        # Update the value in the profile
+        # Update the value in the profile (interned key, so dict lookups can compare by identity)
+        field = sys.intern(field)
+        assert field in _PROFILE_FIELDS, f"Unknown profile field: {field}"
+        if self.current_selected_profile.get(field, _SENTINEL) == value:
+            return # No-op change (e.g. fields being filled on selection), nothing to save
         self.current_selected_profile[field] = value
         
-        # Save settings to persist the change
-        save_settings(self.settings)
+        # Save settings to persist the change (debounced)
+        self._save_timer.start()
 
 if __name__ == "__main__":
-    # Attempt to install requirements if libraries are missing
-    try:
-        import PySide6
-        import minecraft_launcher_lib
-    except ImportError:
-        print("Required libraries not found. Attempting to install...")
+    # Only warnings and errors reach the console, debug output stays off the GUI thread's hot paths
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+
+    # Attempt to install requirements if libraries are missing (checked without importing them)
+    if importlib.util.find_spec('PySide6') is None or importlib.util.find_spec('minecraft_launcher_lib') is None:
+        logger.setLevel(logging.INFO) # The bootstrap exits below, so its progress notices can show
+        logger.warning("Required libraries not found. Attempting to install...")
         try:
             # Try using python -m pip
             subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'])
-            print("Libraries installed successfully. Please restart the launcher.")
+            logger.info("Libraries installed successfully. Please restart the launcher.")
         except Exception as install_error:
-            print(f"Failed to install libraries: {install_error}")
-            print("Please install dependencies manually using: python -m pip install -r requirements.txt")
+            logger.warning("Failed to install libraries: %s", install_error)
+            logger.warning("Please install dependencies manually using: python -m pip install -r requirements.txt")
         sys.exit(1) # Exit after attempting install
 
     app = QApplication(sys.argv)
+    window = MainWindow()
 
-    # Apply QDarkStyleSheet
-    try:
-        import qdarkstyle
-        app.setStyleSheet(qdarkstyle.load_stylesheet()) # Use 'load_stylesheet' for PySide6/PyQt6
-    except ImportError:
-        print("QDarkStyleSheet not found. Launcher will use the default system theme.")
+    # Apply QDarkStyleSheet, unless disabled with "dark_theme": false in the settings file
+    if window.settings.get('dark_theme', True):
+        try:
+            import qdarkstyle
+            app.setStyleSheet(qdarkstyle.load_stylesheet()) # Use 'load_stylesheet' for PySide6/PyQt6
+        except ImportError:
+            logger.warning("QDarkStyleSheet not found. Launcher will use the default system theme.")
 
-    window = MainWindow()
     window.show()
     sys.exit(app.exec()) 
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Runs the launcher under the Scalene profiler.
+
+Usage (from anywhere): python tools/profile_launcher.py
+Use the launcher as usual (add/edit/delete profiles, install, launch), then close it.
+The per-line CPU/memory report is written to launcher.html in the repository root.
+"""
+import importlib.util
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_FILE = "launcher.html"
+
+def main():
+    if importlib.util.find_spec('scalene') is None:
+        print("Scalene not found. Install it with: python -m pip install scalene")
+        return 1
+    # Run from the repository root, like a normal launch, so the usual settings file and minecraft folder are used
+    command = [sys.executable, '-m', 'scalene', '--html', '--outfile', REPORT_FILE, 'main.py']
+    result = subprocess.call(command, cwd=ROOT_DIR)
+    if result == 0:
+        print(f"Profile written to {os.path.join(ROOT_DIR, REPORT_FILE)}")
+    return result
+
+if __name__ == "__main__":
+    sys.exit(main())